@@ -1,19 +1,40 @@
 """Authentication handler for Cisco Catalyst Center API."""
+import asyncio
 import base64
+import math
+import time
 import httpx
+import orjson
 from .config import Config
+from .retry import send_with_retry
+
+# Tokens are documented as valid for 1 hour; assume 55 minutes when the
+# token doesn't carry a readable expiry claim.
+DEFAULT_TOKEN_LIFETIME = 3300.0
+# Refresh this many seconds before the token actually expires.
+TOKEN_REFRESH_MARGIN = 60.0
 
 
 class CatalystCenterAuth:
     """Handles authentication with Cisco Catalyst Center."""
 
-    def __init__(self) -> None:
-        """Initialize authentication handler."""
+    def __init__(self, http_client: httpx.AsyncClient | None = None) -> None:
+        """Initialize authentication handler.
+
+        Args:
+            http_client: Optional shared HTTP client. When provided, token
+                requests reuse its connection pool instead of opening a new
+                connection for every authentication.
+        """
         self.base_url: str = Config.CATALYST_CENTER_URL.rstrip("/")
         self.username: str = Config.CATALYST_CENTER_USERNAME
         self.password: str = Config.CATALYST_CENTER_PASSWORD
         self.verify_ssl: bool = Config.CATALYST_CENTER_VERIFY_SSL
+        self._basic_auth_header: str = self._create_basic_auth_header()
+        self._http_client: httpx.AsyncClient | None = http_client
         self._token: str | None = None
+        self._token_expiry: float = 0.0
+        self._lock: asyncio.Lock = asyncio.Lock()
 
     def _create_basic_auth_header(self) -> str:
         """Create Basic Authentication header value."""
@@ -25,7 +46,10 @@ class CatalystCenterAuth:
         """Obtain authentication token from Catalyst Center.
 
         Authenticates using Basic Authentication and retrieves a token
-        that is valid for 1 hour. Tokens are cached after first retrieval.
+        that is valid for 1 hour. Tokens are cached and proactively refreshed
+        shortly before they expire. Concurrent callers that find the cache
+        empty wait for a single in-flight refresh instead of each requesting
+        their own token.
 
         Returns:
             Authentication token string valid for 1 hour.
@@ -34,29 +58,91 @@ class CatalystCenterAuth:
             httpx.HTTPError: If authentication request fails.
             ValueError: If response doesn't contain a valid token.
         """
-        if self._token:
+        if self._token_is_valid():
             return self._token
 
+        async with self._lock:
+            # Another coroutine may have refreshed the token while we waited
+            if not self._token_is_valid():
+                token = await self._fetch_token()
+                self._token = token
+                self._token_expiry = time.monotonic() + self._token_lifetime(token)
+            return self._token
+
+    def _token_is_valid(self) -> bool:
+        """Check whether a cached token exists and is not about to expire."""
+        return bool(self._token) and time.monotonic() < self._token_expiry - TOKEN_REFRESH_MARGIN
+
+    @staticmethod
+    def _token_lifetime(token: str) -> float:
+        """Determine how many seconds a token remains valid.
+
+        Reads the ``exp`` claim when the token is a JWT, otherwise falls back
+        to the documented token lifetime. The fallback is also used when the
+        claim leaves no more than the refresh margin, e.g. because the local
+        clock is ahead of the controller's, so the token is still reused.
+
+        Args:
+            token: Authentication token returned by Catalyst Center.
+
+        Returns:
+            Remaining token lifetime in seconds.
+        """
+        try:
+            payload = token.split(".")[1]
+            payload += "=" * (-len(payload) % 4)
+            claims = orjson.loads(base64.urlsafe_b64decode(payload))
+            lifetime = float(claims["exp"]) - time.time()
+        except (IndexError, KeyError, TypeError, ValueError):
+            return DEFAULT_TOKEN_LIFETIME
+        if not math.isfinite(lifetime) or lifetime <= TOKEN_REFRESH_MARGIN:
+            return DEFAULT_TOKEN_LIFETIME
+        return lifetime
+
+    async def _fetch_token(self) -> str:
+        """Request a new token from the authentication endpoint.
+
+        Returns:
+            Newly issued authentication token.
+
+        Raises:
+            httpx.HTTPError: If authentication request fails.
+            ValueError: If response doesn't contain a valid token.
+        """
         url = f"{self.base_url}/dna/system/api/v1/auth/token"
         headers = {
             "Content-Type": "application/json",
-            "Authorization": self._create_basic_auth_header()
+            "Authorization": self._basic_auth_header
         }
 
-        async with httpx.AsyncClient(verify=self.verify_ssl) as client:
-            response = await client.post(url, headers=headers)
-            response.raise_for_status()
-            data = response.json()
-            self._token = data.get("Token")
+        if self._http_client is not None:
+            response = await send_with_retry(lambda: self._http_client.post(url, headers=headers))
+        else:
+            async with httpx.AsyncClient(verify=self.verify_ssl) as client:
+                response = await send_with_retry(lambda: client.post(url, headers=headers))
 
-            if not self._token:
-                raise ValueError("No token returned from authentication endpoint")
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        token = data.get("Token")
 
-            return self._token
+        if not token:
+            raise ValueError("No token returned from authentication endpoint")
+
+        return token
 
-    def clear_token(self) -> None:
-        """Clear cached authentication token."""
-        self._token = None
+    async def invalidate_token(self, token: str) -> None:
+        """Clear the cached token if it is still the given (rejected) token.
+
+        Serialized with refreshes so that a stale 401 cannot discard a token
+        another coroutine has just obtained.
+
+        Args:
+            token: The token that was rejected by the API.
+        """
+        async with self._lock:
+            if self._token == token:
+                self._token = None
+                self._token_expiry = 0.0
 
     async def get_auth_headers(self) -> dict[str, str]:
         """
@@ -1,74 +1,449 @@
 """HTTP client for Cisco Catalyst Center API."""
+import asyncio
+import re
+import time
+from collections import defaultdict
+from collections.abc import AsyncIterator, Callable
 import httpx
+import ijson
+import orjson
 from typing import Any
 from .auth import CatalystCenterAuth
 from .config import Config
+from .retry import RETRY_STATUS_CODES, rate_limit_delay, send_with_retry
+
+# Default lifetime in seconds for cached GET responses
+DEFAULT_CACHE_TTL = 15.0
+# Expired cache entries are pruned once the cache grows past this size
+_CACHE_PRUNE_SIZE = 256
+# Matches the API family of an endpoint, e.g. 'network-device' in
+# '/dna/intent/api/v1/network-device/count'
+_API_FAMILY_RE = re.compile(r"/api/v\d+/([^/?]+)")
+
+
+class AdaptiveLimiter:
+    """Concurrency limiter that adapts to the API's observed service rate.
+
+    Uses additive-increase/multiplicative-decrease (AIMD): the limit grows
+    by ``increase`` after each fast successful request and is halved when a
+    request is throttled, fails with a transient error, or exceeds the
+    latency target.
+
+    Usage:
+        async with limiter:
+            ...
+    """
+
+    def __init__(
+        self,
+        initial: float = 4.0,
+        min_limit: float = 1.0,
+        max_limit: float = 32.0,
+        latency_target: float = 5.0,
+        increase: float = 0.5,
+        decrease: float = 0.5
+    ) -> None:
+        """Initialize limiter.
+
+        Args:
+            initial: Initial concurrency limit.
+            min_limit: Lower bound for the concurrency limit.
+            max_limit: Upper bound for the concurrency limit.
+            latency_target: Latency in seconds above which a request is
+                treated as a congestion signal.
+            increase: Amount added to the limit after a fast success.
+            decrease: Factor the limit is multiplied by on congestion.
+        """
+        self.min_limit: float = min_limit
+        self.max_limit: float = max_limit
+        self.latency_target: float = latency_target
+        self.increase: float = increase
+        self.decrease: float = decrease
+        self._limit: float = initial
+        self._in_flight: int = 0
+        self._condition: asyncio.Condition = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight."""
+        return max(1, int(self._limit))
+
+    async def __aenter__(self) -> "AdaptiveLimiter":
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        async with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    def record_success(self, latency: float) -> None:
+        """Record a completed request.
+
+        Args:
+            latency: Request latency in seconds.
+        """
+        if latency <= self.latency_target:
+            self._limit = min(self.max_limit, self._limit + self.increase)
+        else:
+            self.record_failure()
+
+    def record_failure(self) -> None:
+        """Record a throttled or failed request."""
+        self._limit = max(self.min_limit, self._limit * self.decrease)
 
 
 class CatalystCenterClient:
-    """Client for making requests to Catalyst Center API."""
+    """Client for making requests to Catalyst Center API.
+
+    A single ``httpx.AsyncClient`` is held for the lifetime of the client so
+    that connections (and TLS sessions) are kept alive and reused across
+    requests. HTTP/2 is negotiated when the server supports it, letting
+    concurrent requests share one connection. Call :meth:`aclose` when the
+    client is no longer needed.
+    """
 
     def __init__(self) -> None:
         """Initialize API client."""
         self.base_url: str = Config.CATALYST_CENTER_URL.rstrip("/")
         self.verify_ssl: bool = Config.CATALYST_CENTER_VERIFY_SSL
-        self.auth: CatalystCenterAuth = CatalystCenterAuth()
+        self._client: httpx.AsyncClient = httpx.AsyncClient(
+            base_url=self.base_url,
+            verify=self.verify_ssl,
+            http2=True,
+            # Fail fast on unreachable hosts; slow API responses get the full timeout
+            timeout=httpx.Timeout(Config.CATALYST_CENTER_TIMEOUT, connect=5.0),
+            limits=httpx.Limits(
+                max_keepalive_connections=20,
+                max_connections=Config.CATALYST_CENTER_MAX_CONNECTIONS,
+                keepalive_expiry=60.0
+            )
+        )
+        self.auth: CatalystCenterAuth = CatalystCenterAuth(http_client=self._client)
+        self._limiters: defaultdict[str, AdaptiveLimiter] = defaultdict(AdaptiveLimiter)
+        self._cache: dict[tuple[Any, ...], tuple[float, Any]] = {}
+        self._inflight: dict[tuple[Any, ...], asyncio.Future[Any]] = {}
+        # ETag and decoded result of the last response for each cached request
+        self._etags: dict[tuple[Any, ...], tuple[str, Any]] = {}
 
-    async def _make_request(
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self._client.aclose()
+
+    def _limiter_for(self, endpoint: str) -> AdaptiveLimiter:
+        """Get the concurrency limiter for an endpoint's API family.
+
+        Each family (network-device, issues, compliance, ...) adapts
+        independently so that slow bulk endpoints don't throttle fast ones.
+        """
+        match = _API_FAMILY_RE.search(endpoint)
+        return self._limiters[match.group(1) if match else endpoint]
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        stream: bool = False,
+        **kwargs: Any
+    ) -> httpx.Response:
+        """Send a single request through its API family's concurrency limiter.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint path
+            stream: Return as soon as headers arrive without reading the body
+            **kwargs: Additional arguments passed to ``httpx.AsyncClient.build_request``
+
+        Returns:
+            httpx.Response: The unchecked response
+        """
+        request = self._client.build_request(method, endpoint, **kwargs)
+        limiter = self._limiter_for(endpoint)
+        async with limiter:
+            start = time.monotonic()
+            try:
+                response = await self._client.send(request, stream=stream)
+            except httpx.TransportError:
+                limiter.record_failure()
+                raise
+            if response.status_code in RETRY_STATUS_CODES:
+                limiter.record_failure()
+            else:
+                limiter.record_success(time.monotonic() - start)
+                # Nearly out of quota: hold this family's slot until the window resets
+                delay = rate_limit_delay(response.headers)
+                if delay:
+                    await asyncio.sleep(delay)
+            return response
+
+    async def _request(
         self,
         method: str,
         endpoint: str,
         params: dict[str, Any] | None = None,
         json: dict[str, Any] | None = None,
-        retry_auth: bool = True
-    ) -> dict[str, Any]:
+        retry_auth: bool = True,
+        extra_headers: dict[str, str] | None = None
+    ) -> httpx.Response:
         """
         Make authenticated request to Catalyst Center API.
 
+        Requests are admitted through a per-API-family adaptive concurrency
+        limiter. Rate-limited (429) and transient gateway errors (502/503/504)
+        are retried with exponential backoff before an error is raised.
+
         Args:
             method: HTTP method (GET, POST, etc.)
             endpoint: API endpoint path (e.g., '/dna/intent/api/v1/client-health')
             params: Query parameters
             json: JSON request body
             retry_auth: Whether to retry on auth failure
+            extra_headers: Additional request headers (e.g. If-None-Match)
 
         Returns:
-            dict: Response JSON data
+            httpx.Response: Successful or 304 Not Modified response
 
         Raises:
             httpx.HTTPError: If request fails
         """
-        url = f"{self.base_url}{endpoint}"
         headers = await self.auth.get_auth_headers()
+        if extra_headers:
+            headers.update(extra_headers)
 
-        async with httpx.AsyncClient(verify=self.verify_ssl, timeout=30.0) as client:
-            try:
-                response = await client.request(
-                    method=method,
-                    url=url,
+        try:
+            response = await send_with_retry(
+                lambda: self._send(
+                    method,
+                    endpoint,
                     headers=headers,
                     params=params,
                     json=json
                 )
+            )
+            # 304 answers a conditional request and carries no body to check
+            if response.status_code != 304:
                 response.raise_for_status()
-                return response.json()
-            except httpx.HTTPStatusError as e:
-                # If 401 Unauthorized and we haven't retried yet, clear token and retry
-                if e.response.status_code == 401 and retry_auth:
-                    self.auth.clear_token()
-                    return await self._make_request(
-                        method=method,
-                        endpoint=endpoint,
-                        params=params,
-                        json=json,
-                        retry_auth=False
-                    )
-                raise
+            return response
+        except httpx.HTTPStatusError as e:
+            # If 401 Unauthorized and we haven't retried yet, clear token and retry
+            if e.response.status_code == 401 and retry_auth:
+                await self.auth.invalidate_token(headers["X-Auth-Token"])
+                return await self._request(
+                    method=method,
+                    endpoint=endpoint,
+                    params=params,
+                    json=json,
+                    retry_auth=False,
+                    extra_headers=extra_headers
+                )
+            raise
+
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """
+        Make authenticated request and decode the JSON response.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint path (e.g., '/dna/intent/api/v1/client-health')
+            params: Query parameters
+            json: JSON request body
+
+        Returns:
+            dict: Response JSON data
+
+        Raises:
+            httpx.HTTPError: If request fails
+        """
+        response = await self._request(method, endpoint, params=params, json=json)
+        return orjson.loads(response.content)
+
+    async def stream_json_array(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        json_path: str = "response.item",
+        retry_auth: bool = True
+    ) -> AsyncIterator[Any]:
+        """
+        Stream items of a JSON array from a GET response as they arrive.
+
+        The body is decoded incrementally, so large list payloads are never
+        buffered in full and items can be processed while later bytes are
+        still in transit.
+
+        Args:
+            endpoint: API endpoint path (e.g., '/dna/intent/api/v1/network-device')
+            params: Query parameters
+            json_path: ijson prefix of the items to yield
+            retry_auth: Whether to retry on auth failure
+
+        Yields:
+            Decoded array items
+
+        Raises:
+            httpx.HTTPError: If request fails
+        """
+        headers = await self.auth.get_auth_headers()
+        response = await send_with_retry(
+            lambda: self._send("GET", endpoint, stream=True, headers=headers, params=params)
+        )
+        try:
+            if response.status_code == 401 and retry_auth:
+                await response.aclose()
+                await self.auth.invalidate_token(headers["X-Auth-Token"])
+                async for item in self.stream_json_array(endpoint, params, json_path, retry_auth=False):
+                    yield item
+                return
+
+            response.raise_for_status()
+            items = ijson.sendable_list()
+            parser = ijson.items_coro(items, json_path, use_float=True)
+            async for chunk in response.aiter_bytes():
+                parser.send(chunk)
+                for item in items:
+                    yield item
+                del items[:]
+            parser.close()
+            for item in items:
+                yield item
+        finally:
+            await response.aclose()
+
+    async def get(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        cache_ttl: float | None = None
+    ) -> dict[str, Any]:
+        """
+        Make GET request.
+
+        Args:
+            endpoint: API endpoint path
+            params: Query parameters
+            cache_ttl: Seconds a response may be served from cache. Caching is
+                disabled when None; concurrent identical requests share a
+                single upstream call either way. Expired entries are
+                revalidated with the response's ETag when the API sends one.
+
+        Returns:
+            dict: Response JSON data
+        """
+        return await self._cached(("json", endpoint, params), orjson.loads, cache_ttl)
+
+    async def get_raw(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        cache_ttl: float | None = None
+    ) -> bytes:
+        """
+        Make GET request and return the undecoded response body.
+
+        Lets callers validate JSON straight into Pydantic models without
+        building an intermediate dict.
+
+        Args:
+            endpoint: API endpoint path
+            params: Query parameters
+            cache_ttl: Seconds a response may be served from cache (see get).
+
+        Returns:
+            bytes: Raw response body
+        """
+        return await self._cached(("raw", endpoint, params), lambda content: content, cache_ttl)
+
+    async def _cached(
+        self,
+        request_key: tuple[str, str, dict[str, Any] | None],
+        decode: Callable[[bytes], Any],
+        cache_ttl: float | None
+    ) -> Any:
+        """Serve a GET request from cache, coalescing concurrent identical fetches.
+
+        Args:
+            request_key: Response kind, endpoint and query parameters
+            decode: Converts the response body into the returned result
+            cache_ttl: Seconds the fetched result stays fresh; when None the
+                result is only shared with concurrent callers, not cached
+
+        Returns:
+            Cached or freshly fetched result
+        """
+        kind, endpoint, params = request_key
+        key = (kind, endpoint, tuple(sorted(params.items())) if params else ())
+        if cache_ttl:
+            cached = self._cache.get(key)
+            if cached is not None and cached[0] > time.monotonic():
+                return cached[1]
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_and_cache(key, endpoint, params, decode, cache_ttl))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield the shared request so one caller's cancellation doesn't fail the rest
+        return await asyncio.shield(task)
+
+    def invalidate_cache(self) -> None:
+        """Drop all cached responses.
+
+        Called after every successful POST, which may change data on
+        Catalyst Center, so that subsequent reads are not served stale results.
+        """
+        self._cache.clear()
+        self._etags.clear()
+
+    async def _fetch_and_cache(
+        self,
+        key: tuple[Any, ...],
+        endpoint: str,
+        params: dict[str, Any] | None,
+        decode: Callable[[bytes], Any],
+        cache_ttl: float | None
+    ) -> Any:
+        """Perform a GET and store its decoded result in the cache.
+
+        Cacheable requests are made conditional on the ETag of the previous
+        response, so an unchanged resource costs a bodiless 304 instead of a
+        full download and decode.
+        """
+        validator = self._etags.get(key) if cache_ttl else None
+        response = await self._request(
+            "GET",
+            endpoint,
+            params=params,
+            extra_headers={"If-None-Match": validator[0]} if validator else None
+        )
+        if validator is not None and response.status_code == 304:
+            etag, result = validator
+        else:
+            etag, result = response.headers.get("ETag"), decode(response.content)
+        if not cache_ttl:
+            return result
 
-    async def get(self, endpoint: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
-        """Make GET request."""
-        return await self._make_request("GET", endpoint, params=params)
+        if etag:
+            if len(self._etags) >= _CACHE_PRUNE_SIZE:
+                self._etags.clear()
+            self._etags[key] = (etag, result)
+        else:
+            self._etags.pop(key, None)
+        now = time.monotonic()
+        if len(self._cache) >= _CACHE_PRUNE_SIZE:
+            self._cache = {k: v for k, v in self._cache.items() if v[0] > now}
+        self._cache[key] = (now + cache_ttl, result)
+        return result
 
     async def post(self, endpoint: str, json: dict[str, Any] | None = None) -> dict[str, Any]:
-        """Make POST request."""
-        return await self._make_request("POST", endpoint, json=json)
+        """Make POST request, then drop cached responses it may have made stale."""
+        result = await self._make_request("POST", endpoint, json=json)
+        self.invalidate_cache()
+        return result
@@ -7,19 +7,50 @@ load_dotenv()
 
 
 class Config:
-    """Configuration settings for Catalyst Center API."""
+    """Configuration settings for Catalyst Center API.
 
-    CATALYST_CENTER_URL = os.getenv("CATALYST_CENTER_URL", "")
-    CATALYST_CENTER_USERNAME = os.getenv("CATALYST_CENTER_USERNAME", "")
-    CATALYST_CENTER_PASSWORD = os.getenv("CATALYST_CENTER_PASSWORD", "")
-    CATALYST_CENTER_VERIFY_SSL = os.getenv("CATALYST_CENTER_VERIFY_SSL", "true").lower() == "true"
+    Settings are read from the environment by :meth:`validate`, which must
+    run before a ``CatalystCenterClient`` is created.
+    """
+
+    CATALYST_CENTER_URL = ""
+    CATALYST_CENTER_USERNAME = ""
+    CATALYST_CENTER_PASSWORD = ""
+    CATALYST_CENTER_VERIFY_SSL = True
+    # HTTP request timeout (seconds) and connection pool size
+    CATALYST_CENTER_TIMEOUT = 30.0
+    CATALYST_CENTER_MAX_CONNECTIONS = 100
+    # Line-profile tool calls and write the stats on shutdown (requires line_profiler)
+    CATALYST_PROFILE = False
 
     @classmethod
     def validate(cls) -> None:
-        """Validate required configuration settings."""
+        """Read configuration settings from the environment and validate them."""
+        cls.CATALYST_CENTER_URL = os.getenv("CATALYST_CENTER_URL", "")
+        cls.CATALYST_CENTER_USERNAME = os.getenv("CATALYST_CENTER_USERNAME", "")
+        cls.CATALYST_CENTER_PASSWORD = os.getenv("CATALYST_CENTER_PASSWORD", "")
+        cls.CATALYST_CENTER_VERIFY_SSL = os.getenv("CATALYST_CENTER_VERIFY_SSL", "true").lower() == "true"
+        cls.CATALYST_PROFILE = os.getenv("CATALYST_PROFILE", "false").lower() in ("1", "true")
+
         if not cls.CATALYST_CENTER_URL:
             raise ValueError("CATALYST_CENTER_URL environment variable is required")
         if not cls.CATALYST_CENTER_USERNAME:
             raise ValueError("CATALYST_CENTER_USERNAME environment variable is required")
         if not cls.CATALYST_CENTER_PASSWORD:
             raise ValueError("CATALYST_CENTER_PASSWORD environment variable is required")
+
+        timeout = os.getenv("CATALYST_CENTER_TIMEOUT", "30")
+        try:
+            cls.CATALYST_CENTER_TIMEOUT = float(timeout)
+        except ValueError:
+            raise ValueError(f"CATALYST_CENTER_TIMEOUT must be a number of seconds, got '{timeout}'") from None
+        if not cls.CATALYST_CENTER_TIMEOUT > 0:
+            raise ValueError(f"CATALYST_CENTER_TIMEOUT must be positive, got '{timeout}'")
+
+        max_connections = os.getenv("CATALYST_CENTER_MAX_CONNECTIONS", "100")
+        try:
+            cls.CATALYST_CENTER_MAX_CONNECTIONS = int(max_connections)
+        except ValueError:
+            raise ValueError(f"CATALYST_CENTER_MAX_CONNECTIONS must be an integer, got '{max_connections}'") from None
+        if cls.CATALYST_CENTER_MAX_CONNECTIONS < 1:
+            raise ValueError(f"CATALYST_CENTER_MAX_CONNECTIONS must be at least 1, got '{max_connections}'")
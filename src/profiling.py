@@ -0,0 +1,49 @@
+"""Optional line profiling of the server's request handling paths.
+
+The server is latency-bound (network I/O, JSON parsing and Pydantic
+validation of response lists), so profiles should be read for time spent
+in those stages before reaching for compute-level optimizations.
+"""
+import logging
+from collections.abc import Callable, Iterable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# File the collected line timings are written to on shutdown
+PROFILE_OUTPUT = "/tmp/catalyst_profile.txt"
+
+
+def start_line_profiler(functions: Iterable[Callable[..., Any]]) -> Any | None:
+    """Start line profiling the given functions.
+
+    Args:
+        functions: Functions (including coroutine functions) to profile.
+
+    Returns:
+        The running ``LineProfiler``, or None if line_profiler is not installed.
+    """
+    try:
+        from line_profiler import LineProfiler
+    except ImportError:
+        logger.warning("CATALYST_PROFILE is set but line_profiler is not installed; profiling disabled")
+        return None
+
+    profiler = LineProfiler()
+    for function in functions:
+        profiler.add_function(function)
+    profiler.enable()
+    return profiler
+
+
+def stop_line_profiler(profiler: Any, path: str = PROFILE_OUTPUT) -> None:
+    """Stop a profiler started by :func:`start_line_profiler` and write its stats.
+
+    Args:
+        profiler: The running ``LineProfiler``.
+        path: File to write the line timings to.
+    """
+    profiler.disable()
+    with open(path, "w") as stream:
+        profiler.print_stats(stream=stream)
+    logger.info("Line profile written to %s", path)
@@ -0,0 +1,123 @@
+"""Retry with exponential backoff for Cisco Catalyst Center API requests."""
+import asyncio
+import random
+import time
+from collections.abc import Awaitable, Callable
+from email.utils import parsedate_to_datetime
+import httpx
+
+# Status codes that indicate a transient condition worth retrying
+RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+MAX_RETRIES = 4
+BACKOFF_BASE = 0.25
+BACKOFF_CAP = 10.0
+# Upper bound on how long a server-provided Retry-After may stall a request
+RETRY_AFTER_CAP = 30.0
+# Rate limit header names, in order of preference
+_REMAINING_HEADERS = ("X-RateLimit-Remaining", "RateLimit-Remaining", "X-Rate-Limit-Remaining")
+_LIMIT_HEADERS = ("X-RateLimit-Limit", "RateLimit-Limit", "X-Rate-Limit-Limit")
+_RESET_HEADERS = ("X-RateLimit-Reset", "RateLimit-Reset", "X-Rate-Limit-Reset")
+# Reset values above this are epoch timestamps rather than delta-seconds
+_EPOCH_THRESHOLD = 1_000_000_000
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header value.
+
+    Args:
+        value: Header value, either delay-seconds or an HTTP-date.
+
+    Returns:
+        Delay in seconds, or None if the value is missing or invalid.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _header_number(headers: httpx.Headers, names: tuple[str, ...]) -> float | None:
+    """Return the first of the given headers that holds a number."""
+    for name in names:
+        value = headers.get(name)
+        if value is not None:
+            try:
+                return float(value)
+            except ValueError:
+                continue
+    return None
+
+
+def rate_limit_delay(headers: httpx.Headers) -> float:
+    """Compute how long to pause before the rate limit quota runs out.
+
+    Reads remaining-quota headers and, when the remaining quota drops to
+    at most 2 requests or 10% of the limit, returns the time until the
+    quota window resets.
+
+    Args:
+        headers: Response headers.
+
+    Returns:
+        Delay in seconds, 0.0 if no pause is needed.
+    """
+    remaining = _header_number(headers, _REMAINING_HEADERS)
+    if remaining is None:
+        return 0.0
+    limit = _header_number(headers, _LIMIT_HEADERS) or 0.0
+    if remaining > max(2.0, 0.1 * limit):
+        return 0.0
+    reset = _header_number(headers, _RESET_HEADERS)
+    if reset is None:
+        return 0.0
+    if reset > _EPOCH_THRESHOLD:
+        reset -= time.time()
+    return min(max(0.0, reset), RETRY_AFTER_CAP)
+
+
+def retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Compute how long to wait before retrying a failed request.
+
+    Honors Retry-After when present, otherwise uses exponential backoff
+    with full jitter so concurrent callers don't retry in lockstep.
+
+    Args:
+        response: The response that triggered the retry.
+        attempt: Zero-based retry attempt number.
+
+    Returns:
+        Delay in seconds.
+    """
+    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+    if retry_after is not None:
+        return min(retry_after, RETRY_AFTER_CAP)
+    return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt))
+
+
+async def send_with_retry(send: Callable[[], Awaitable[httpx.Response]]) -> httpx.Response:
+    """Send a request, retrying on rate limiting and transient server errors.
+
+    Args:
+        send: Coroutine function that sends the request once and returns
+            the response.
+
+    Returns:
+        The final response. Status is not checked; callers should call
+        ``raise_for_status()`` as appropriate.
+
+    Raises:
+        httpx.HTTPError: If the request cannot be sent.
+    """
+    for attempt in range(MAX_RETRIES):
+        response = await send()
+        if response.status_code not in RETRY_STATUS_CODES:
+            return response
+        await response.aclose()
+        await asyncio.sleep(retry_delay(response, attempt))
+    return await send()
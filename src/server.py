@@ -2,22 +2,30 @@
 
 This server provides MCP tools for interacting with Cisco Catalyst Center.
 """
+import asyncio
+import functools
+import inspect
+import logging
+import re
+from collections.abc import Awaitable, Callable
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from typing import Any
+from typing import Annotated, Any, Generic, TypeVar
 import httpx
-from pydantic import BaseModel, Field
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field, TypeAdapter, model_validator
 from mcp.server.fastmcp import FastMCP, Context
 from mcp.server.session import ServerSession
 
 from .config import Config
-from .client import CatalystCenterClient
+from .client import DEFAULT_CACHE_TTL, CatalystCenterClient
+from .profiling import start_line_profiler, stop_line_profiler
 
-# Validate configuration on startup
-Config.validate()
+logger = logging.getLogger(__name__)
 
 
-# Pydantic models for structured output
+# Pydantic models for structured output.
+# Response wrappers holding already-validated items are built by the tools
+# with model_construct() and are not re-validated.
 class ClientCounts(BaseModel):
     """Client count information."""
     wired_count: int = Field(description="Number of wired clients connected to the network")
@@ -28,30 +36,32 @@ class ClientCounts(BaseModel):
 
 class NetworkDevice(BaseModel):
     """Network device information."""
-    hostname: str | None = Field(description="Device hostname")
-    managementIpAddress: str | None = Field(description="Management IP address")
-    family: str | None = Field(description="Device family (e.g., 'Switches and Hubs')")
-    type: str | None = Field(description="Device type")
-    softwareVersion: str | None = Field(description="Software version")
-    reachabilityStatus: str | None = Field(description="Reachability status")
-    serialNumber: str | None = Field(description="Serial number")
-    id: str | None = Field(description="Device UUID")
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+    hostname: str | None = Field(default=None, description="Device hostname")
+    managementIpAddress: str | None = Field(default=None, description="Management IP address")
+    family: str | None = Field(default=None, description="Device family (e.g., 'Switches and Hubs')")
+    type: str | None = Field(default=None, description="Device type")
+    softwareVersion: str | None = Field(default=None, description="Software version")
+    reachabilityStatus: str | None = Field(default=None, description="Reachability status")
+    serialNumber: str | None = Field(default=None, description="Serial number")
+    id: str | None = Field(default=None, description="Device UUID")
 
 
 class NetworkDevicesResponse(BaseModel):
     """Response containing list of network devices."""
     devices: list[NetworkDevice] = Field(description="List of network devices")
-    count: int = Field(description="Number of devices returned")
+    count: int = Field(description="Number of devices returned, or of all matching devices when count_only is set")
 
 
 class CategoryHealth(BaseModel):
     """Health information for a device category."""
-    healthScore: int = Field(description="Overall health score (-1 means not applicable)")
-    totalCount: int = Field(description="Total number of devices in category")
-    goodCount: int = Field(description="Number of devices with good health")
-    badCount: int = Field(description="Number of devices with bad health")
-    fairCount: int = Field(description="Number of devices with fair health")
-    unmonitoredCount: int = Field(description="Number of unmonitored devices")
+    healthScore: int = Field(default=-1, description="Overall health score (-1 means not applicable)")
+    totalCount: int = Field(default=0, description="Total number of devices in category")
+    goodCount: int = Field(default=0, description="Number of devices with good health")
+    badCount: int = Field(default=0, description="Number of devices with bad health")
+    fairCount: int = Field(default=0, description="Number of devices with fair health")
+    unmonitoredCount: int = Field(default=0, description="Number of unmonitored devices")
 
 
 class NetworkHealthResponse(BaseModel):
@@ -62,13 +72,15 @@ class NetworkHealthResponse(BaseModel):
 
 class Issue(BaseModel):
     """Network issue information."""
-    issueId: str | None = Field(description="Unique issue identifier")
-    name: str | None = Field(description="Issue name/title")
-    priority: str | None = Field(description="Issue priority (P1, P2, P3, P4)")
-    status: str | None = Field(description="Issue status (ACTIVE, IGNORED, RESOLVED)")
-    category: str | None = Field(description="Issue category")
-    issueOccurenceCount: int | None = Field(description="Number of times issue occurred")
-    lastOccurenceTime: int | None = Field(description="Last occurrence timestamp (epoch ms)")
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+    issueId: str | None = Field(default=None, description="Unique issue identifier")
+    name: str | None = Field(default=None, description="Issue name/title")
+    priority: str | None = Field(default=None, description="Issue priority (P1, P2, P3, P4)")
+    status: str | None = Field(default=None, description="Issue status (ACTIVE, IGNORED, RESOLVED)")
+    category: str | None = Field(default=None, description="Issue category")
+    issueOccurenceCount: int | None = Field(default=None, description="Number of times issue occurred")
+    lastOccurenceTime: int | None = Field(default=None, description="Last occurrence timestamp (epoch ms)")
 
 
 class IssuesResponse(BaseModel):
@@ -79,14 +91,16 @@ class IssuesResponse(BaseModel):
 
 class SiteHealth(BaseModel):
     """Site health information."""
-    siteName: str | None = Field(description="Site name")
-    siteType: str | None = Field(description="Site type (AREA, BUILDING)")
-    healthyNetworkDevicePercentage: int | None = Field(description="Percentage of healthy network devices")
-    healthyClientsPercentage: int | None = Field(description="Percentage of healthy clients")
-    numberOfClients: int | None = Field(description="Number of clients at site")
-    numberOfNetworkDevice: int | None = Field(description="Number of network devices at site")
-    networkHealthAverage: int | None = Field(description="Average network health score")
-    clientHealthAverage: int | None = Field(description="Average client health score")
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+    siteName: str | None = Field(default=None, description="Site name")
+    siteType: str | None = Field(default=None, description="Site type (AREA, BUILDING)")
+    healthyNetworkDevicePercentage: int | None = Field(default=None, description="Percentage of healthy network devices")
+    healthyClientsPercentage: int | None = Field(default=None, description="Percentage of healthy clients")
+    numberOfClients: int | None = Field(default=None, description="Number of clients at site")
+    numberOfNetworkDevice: int | None = Field(default=None, description="Number of network devices at site")
+    networkHealthAverage: int | None = Field(default=None, description="Average network health score")
+    clientHealthAverage: int | None = Field(default=None, description="Average client health score")
 
 
 class SiteHealthResponse(BaseModel):
@@ -97,10 +111,12 @@ class SiteHealthResponse(BaseModel):
 
 class ComplianceDetail(BaseModel):
     """Compliance detail for a network device."""
-    deviceUuid: str = Field(description="Device UUID")
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+    deviceUuid: str = Field(default="", description="Device UUID")
     displayName: str | None = Field(default=None, description="Device display name")
-    complianceType: str = Field(description="Type of compliance check (EOX, IMAGE, PSIRT, etc.)")
-    status: str = Field(description="Compliance status (COMPLIANT, NON_COMPLIANT, etc.)")
+    complianceType: str = Field(default="", description="Type of compliance check (EOX, IMAGE, PSIRT, etc.)")
+    status: str = Field(default="", description="Compliance status (COMPLIANT, NON_COMPLIANT, etc.)")
     category: str | None = Field(default=None, description="Compliance category")
     lastSyncTime: int | None = Field(default=None, description="Last sync timestamp (epoch ms)")
     lastUpdateTime: int | None = Field(default=None, description="Last update timestamp (epoch ms)")
@@ -112,6 +128,7 @@ class ComplianceDetailResponse(BaseModel):
     """Response containing compliance details."""
     devices: list[ComplianceDetail] = Field(description="List of device compliance details")
     count: int = Field(description="Number of devices returned")
+    truncated: bool = Field(default=False, description="Whether more matching records exist than were returned")
 
 
 class ComplianceCountResponse(BaseModel):
@@ -123,32 +140,51 @@ class ComplianceCountResponse(BaseModel):
 
 class EoXSummaryResponse(BaseModel):
     """Network-wide EoX summary."""
-    hardware_count: int = Field(description="Number of devices with hardware EoX alerts")
-    software_count: int = Field(description="Number of devices with software EoX alerts")
-    module_count: int = Field(description="Number of devices with module EoX alerts")
-    total_count: int = Field(description="Total number of devices with any EoX alerts")
+    hardware_count: int = Field(default=0, validation_alias=AliasChoices("hardware_count", "hardwareCount"), description="Number of devices with hardware EoX alerts")
+    software_count: int = Field(default=0, validation_alias=AliasChoices("software_count", "softwareCount"), description="Number of devices with software EoX alerts")
+    module_count: int = Field(default=0, validation_alias=AliasChoices("module_count", "moduleCount"), description="Number of devices with module EoX alerts")
+    total_count: int = Field(default=0, validation_alias=AliasChoices("total_count", "totalCount"), description="Total number of devices with any EoX alerts")
+
+
+# Maps the eoxType of an API summary entry to the EoXDeviceSummary count field
+_EOX_TYPE_FIELDS = {"HARDWARE": "hardware_count", "SOFTWARE": "software_count", "MODULE": "module_count"}
 
 
 class EoXDeviceSummary(BaseModel):
     """EoX summary for a device."""
-    device_id: str = Field(description="Device UUID")
-    alert_count: int = Field(description="Total number of EoX alerts for this device")
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+    device_id: str = Field(default="", validation_alias=AliasChoices("device_id", "deviceId"), description="Device UUID")
+    alert_count: int = Field(default=0, validation_alias=AliasChoices("alert_count", "alertCount"), description="Total number of EoX alerts for this device")
     hardware_count: int | None = Field(default=None, description="Number of hardware EoX alerts")
     software_count: int | None = Field(default=None, description="Number of software EoX alerts")
     module_count: int | None = Field(default=None, description="Number of module EoX alerts")
-    scan_status: str | None = Field(default=None, description="Scan status")
-    last_scan_time: int | None = Field(default=None, description="Last scan timestamp (epoch ms)")
+    scan_status: str | None = Field(default=None, validation_alias=AliasChoices("scan_status", "scanStatus"), description="Scan status")
+    last_scan_time: int | None = Field(default=None, validation_alias=AliasChoices("last_scan_time", "lastScanTime"), description="Last scan timestamp (epoch ms)")
     comments: list[str] | None = Field(default=None, description="Additional comments")
 
+    @model_validator(mode="before")
+    @classmethod
+    def _flatten_summary(cls, data: Any) -> Any:
+        """Spread the API's per-type ``summary`` list into the *_count fields."""
+        if isinstance(data, dict) and isinstance(data.get("summary"), list):
+            data = dict(data)
+            counts = {item.get("eoxType"): item.get("count", 0) for item in data.pop("summary") if isinstance(item, dict)}
+            data.update((field, counts[eox_type]) for eox_type, field in _EOX_TYPE_FIELDS.items() if eox_type in counts)
+        return data
+
 
 class EoXDevicesResponse(BaseModel):
     """Response containing EoX device summaries."""
     devices: list[EoXDeviceSummary] = Field(description="List of devices with EoX information")
     count: int = Field(description="Number of devices returned")
+    truncated: bool = Field(default=False, description="Whether more devices exist than were returned")
 
 
 class EoXBulletin(BaseModel):
     """EoX bulletin details."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     bulletinNumber: str | None = Field(default=None, description="Bulletin number")
     bulletinName: str | None = Field(default=None, description="Bulletin name/title")
     eoxType: str | None = Field(default=None, description="EoX type (HARDWARE, SOFTWARE, MODULE)")
@@ -170,6 +206,212 @@ class EoXDeviceDetailsResponse(BaseModel):
     last_scan_time: int | None = Field(default=None, description="Last scan timestamp (epoch ms)")
 
 
+class EoXDeviceDetailsBatchResponse(BaseModel):
+    """Response containing detailed EoX information for multiple devices."""
+    devices: list[EoXDeviceDetailsResponse] = Field(description="EoX details for each device retrieved successfully")
+    errors: dict[str, str] = Field(default_factory=dict, description="Error message by device UUID for devices that could not be retrieved")
+    count: int = Field(description="Number of devices retrieved successfully")
+
+
+T = TypeVar("T")
+
+
+class _ListEnvelope(BaseModel, Generic[T]):
+    """Catalyst Center API envelope around a list of items."""
+    response: list[T] | None = None
+
+
+# Catalyst Center Intent API paths
+_CLIENT_HEALTH_PATH = "/dna/intent/api/v1/client-health"
+_NETWORK_DEVICES_PATH = "/dna/intent/api/v1/network-device"
+_NETWORK_DEVICES_COUNT_PATH = "/dna/intent/api/v1/network-device/count"
+_NETWORK_HEALTH_PATH = "/dna/intent/api/v1/network-health"
+_ISSUES_PATH = "/dna/intent/api/v1/issues"
+_SITE_HEALTH_PATH = "/dna/intent/api/v1/site-health"
+_CLIENT_DETAIL_PATH = "/dna/intent/api/v1/client-detail"
+_COMPLIANCE_DETAIL_PATH = "/dna/intent/api/v1/compliance/detail"
+_COMPLIANCE_COUNT_PATH = "/dna/intent/api/v1/compliance/detail/count"
+_EOX_SUMMARY_PATH = "/dna/intent/api/v1/eox-status/summary"
+_EOX_DEVICES_PATH = "/dna/intent/api/v1/eox-status/device"
+# Prefix of per-device EoX details; the device UUID is appended
+_EOX_DEVICE_PATH = "/dna/intent/api/v1/eox-status/device/"
+
+
+class InvalidArgumentError(ValueError):
+    """Raised when a tool argument is rejected before any request is made."""
+
+
+_UUID_RE = re.compile(r"[0-9a-fA-F]{8}-(?:[0-9a-fA-F]{4}-){3}[0-9a-fA-F]{12}")
+
+
+def _check_device_id(device_id: str) -> None:
+    """Reject a device ID that is not a UUID before it is sent to the API.
+
+    Raises:
+        InvalidArgumentError: If ``device_id`` is not a UUID.
+    """
+    if not _UUID_RE.fullmatch(device_id):
+        raise InvalidArgumentError(f"device_id '{device_id}' is not a device UUID")
+
+
+# Validators for API list envelopes; built once at import time
+_DEVICES_ADAPTER = TypeAdapter(_ListEnvelope[NetworkDevice])
+_ISSUES_ADAPTER = TypeAdapter(_ListEnvelope[Issue])
+_SITES_ADAPTER = TypeAdapter(_ListEnvelope[SiteHealth])
+_COMPLIANCE_ADAPTER = TypeAdapter(_ListEnvelope[ComplianceDetail])
+_EOX_DEVICES_ADAPTER = TypeAdapter(_ListEnvelope[EoXDeviceSummary])
+_CATEGORY_HEALTH_ADAPTER = TypeAdapter(list[CategoryHealth])
+_BULLETINS_ADAPTER = TypeAdapter(list[EoXBulletin])
+_COUNT_ADAPTER = TypeAdapter(int)
+
+
+# Responses with more items than this are logged as candidates for optimization
+_LARGE_RESPONSE_ITEMS = 1000
+
+
+async def _get_items(
+    client: CatalystCenterClient,
+    endpoint: str,
+    params: dict[str, Any] | None,
+    adapter: TypeAdapter[_ListEnvelope[T]],
+    cache_ttl: float | None = None
+) -> list[T]:
+    """Fetch a list endpoint and validate its items straight from the JSON body.
+
+    Parsing and model construction happen in a single pydantic-core pass,
+    without building an intermediate dict.
+    """
+    raw = await client.get_raw(endpoint, params=params, cache_ttl=cache_ttl)
+    items = adapter.validate_json(raw).response or []
+    if len(items) > _LARGE_RESPONSE_ITEMS:
+        logger.info("%s returned %d items", endpoint, len(items))
+    return items
+
+
+# Query parameter names for optional tool filters, in tool argument order
+_DEVICE_FILTER_PARAMS = ("hostname", "managementIpAddress", "family", "type")
+_ISSUE_FILTER_PARAMS = ("priority", "issueStatus", "siteId", "deviceId", "macAddress", "aiDriven")
+_COMPLIANCE_FILTER_PARAMS = ("complianceType", "complianceStatus", "deviceUuid")
+
+
+# Accepted values for case-insensitive issue filters
+_ISSUE_PRIORITIES = frozenset({"P1", "P2", "P3", "P4"})
+_ISSUE_STATUSES = frozenset({"ACTIVE", "IGNORED", "RESOLVED"})
+_AI_DRIVEN_VALUES = frozenset({"YES", "NO"})
+
+
+def _normalize_choice(name: str, value: str | None, choices: frozenset[str]) -> str | None:
+    """Upper-case a case-insensitive filter value and check it is accepted.
+
+    Raises:
+        InvalidArgumentError: If the value is not one of ``choices``.
+    """
+    if not value:
+        return None
+    normalized = value.upper()
+    if normalized not in choices:
+        raise InvalidArgumentError(f"{name} '{value}' is not one of: {', '.join(sorted(choices))}")
+    return normalized
+
+
+def _filter_params(names: tuple[str, ...], values: tuple[Any, ...]) -> dict[str, Any] | None:
+    """Map API query parameter names to filter values, dropping unset filters.
+
+    Returns None when no filter is set so that no query string is encoded.
+    """
+    return {name: value for name, value in zip(names, values) if value} or None
+
+
+# Largest page size accepted by paginated list endpoints
+_MAX_PAGE_SIZE = 500
+# Cache lifetime for aggregate compliance and EoX data, which changes on the order of hours
+_AGGREGATE_CACHE_TTL = 300.0
+
+
+async def _fetch_pages(
+    client: CatalystCenterClient,
+    endpoint: str,
+    params: dict[str, Any] | None,
+    adapter: TypeAdapter[_ListEnvelope[T]],
+    total: int,
+    cache_ttl: float | None = None
+) -> list[T]:
+    """Fetch up to ``total`` items from an offset-paginated list endpoint.
+
+    Pages are requested concurrently; the client's adaptive limiter bounds
+    how many are actually in flight.
+    """
+    pages = await asyncio.gather(*(
+        _get_items(
+            client,
+            endpoint,
+            {**(params or {}), "offset": offset, "limit": min(_MAX_PAGE_SIZE, total - offset + 1)},
+            adapter,
+            cache_ttl=cache_ttl
+        )
+        for offset in range(1, total + 1, _MAX_PAGE_SIZE)
+    ))
+    return [item for page in pages for item in page]
+
+
+# Number of pages requested at once when sweeping a list endpoint of unknown size
+_PAGE_WAVE_SIZE = 8
+
+
+async def _fetch_all_pages(
+    fetch_page: Callable[[int], Awaitable[list[T]]],
+    page_size: int,
+    max_items: int,
+    offset: int = 1
+) -> tuple[list[T], bool]:
+    """Fetch the pages of an offset-paginated list endpoint of unknown size.
+
+    Pages are requested concurrently in waves of up to ``_PAGE_WAVE_SIZE``
+    until a short page marks the end of the list, or more than ``max_items``
+    items have been received.
+
+    Args:
+        fetch_page: Coroutine function returning the items at a 1-based offset.
+        page_size: Number of items requested per page.
+        max_items: Maximum number of items to return.
+        offset: Offset of the first item to fetch.
+
+    Returns:
+        The first ``max_items`` items at most, and whether more items exist.
+    """
+    items: list[T] = []
+    while len(items) <= max_items:
+        # Request only the pages needed to tell whether more than max_items exist
+        wave_size = min(_PAGE_WAVE_SIZE, (max_items - len(items)) // page_size + 1)
+        pages = await asyncio.gather(*(
+            fetch_page(offset + i * page_size) for i in range(wave_size)
+        ))
+        for page in pages:
+            items.extend(page)
+            if len(page) < page_size:
+                return items[:max_items], len(items) > max_items
+        offset += wave_size * page_size
+    return items[:max_items], True
+
+
+async def _fetch_eox_device_details(client: CatalystCenterClient, device_id: str) -> EoXDeviceDetailsResponse:
+    """Fetch and validate the EoX details of a single device."""
+    response = await client.get(_EOX_DEVICE_PATH + device_id)
+
+    device_data = response.get("response", {})
+
+    # Bulletin fields share the API's camelCase names, so items validate as-is
+    eox_details = _BULLETINS_ADAPTER.validate_python(device_data.get("eoxDetails") or [])
+
+    return EoXDeviceDetailsResponse(
+        device_id=device_data.get("deviceId", device_id),
+        alert_count=device_data.get("alertCount", 0),
+        eox_details=eox_details,
+        scan_status=device_data.get("scanStatus"),
+        last_scan_time=device_data.get("lastScanTime")
+    )
+
+
 # Application context for lifespan management
 @dataclass
 class AppContext:
@@ -181,21 +423,172 @@ class AppContext:
 async def app_lifespan(server: FastMCP):
     """Manage application lifecycle and shared resources.
 
-    Initializes the Catalyst Center API client on startup.
+    Validates configuration, initializes the Catalyst Center API client and
+    obtains an authentication token on startup. On shutdown, closes the
+    client's connection pool and that of the fallback client, if one was
+    created. When CATALYST_PROFILE is set, the module's coroutine functions
+    are line profiled for the lifetime of the server.
     """
+    Config.validate()
+    profiler = None
+    if Config.CATALYST_PROFILE:
+        # Unwrap tools so their bodies, not the error-handling wrapper, are profiled
+        profiler = start_line_profiler(
+            inspect.unwrap(fn) for fn in globals().values()
+            if inspect.iscoroutinefunction(fn) and fn.__module__ == __name__
+        )
     client = CatalystCenterClient()
     try:
+        # Authenticate up front so the first tool call doesn't pay for it
+        try:
+            await client.auth.get_token()
+        except (httpx.HTTPError, ValueError) as e:
+            logger.warning("Initial authentication failed, retrying on first request: %s", e)
         yield AppContext(client=client)
     finally:
-        # Cleanup if needed
+        await client.aclose()
+        await _close_fallback_client()
+        if profiler is not None:
+            stop_line_profiler(profiler)
+
+
+# Client shared by tool calls made without an MCP context (e.g. tests), and
+# the event loop its connection pool and locks are bound to
+_fallback_client: CatalystCenterClient | None = None
+_fallback_loop: asyncio.AbstractEventLoop | None = None
+
+
+async def _get_fallback_client() -> CatalystCenterClient:
+    """Get the shared client used when no MCP context is available.
+
+    Created on first use, after validating the configuration, so its
+    connection pool is reused across calls.
+    The client is rebuilt when called from a different event loop (e.g.
+    successive ``asyncio.run`` calls), since its connections and locks
+    cannot be used outside the loop that created them.
+    """
+    global _fallback_client, _fallback_loop
+    loop = asyncio.get_running_loop()
+    if _fallback_client is not None and _fallback_loop is not loop:
+        stale, _fallback_client = _fallback_client, None
+        try:
+            await stale.aclose()
+        except RuntimeError:
+            # Connections bound to a closed loop can't be shut down cleanly
+            pass
+    if _fallback_client is None:
+        Config.validate()
+        _fallback_client = CatalystCenterClient()
+        _fallback_loop = loop
+    return _fallback_client
+
+
+async def _close_fallback_client() -> None:
+    """Close the shared fallback client, if it was created."""
+    global _fallback_client, _fallback_loop
+    if _fallback_client is not None:
+        await _fallback_client.aclose()
+        _fallback_client = None
+        _fallback_loop = None
+
+
+class _NullContext:
+    """No-op stand-in for the MCP context when a tool is called without one.
+
+    Lets tools log and report progress unconditionally instead of checking
+    for a context before every call.
+    """
+
+    async def info(self, message: str, **kwargs: Any) -> None:
         pass
 
+    async def error(self, message: str, **kwargs: Any) -> None:
+        pass
+
+    async def report_progress(self, progress: float, total: float | None = None, message: str | None = None) -> None:
+        pass
+
+
+_NULL_CTX = _NullContext()
+
+
+async def _ctx_info(ctx: Context[ServerSession, AppContext] | _NullContext, template: str, *args: Any) -> None:
+    """Send an info message to the MCP context, formatting it only if there is one to receive it.
+
+    Args:
+        ctx: MCP context or the null context.
+        template: %-style message template.
+        *args: Values substituted into the template.
+    """
+    if ctx is not _NULL_CTX:
+        await ctx.info(template % args)
+
+
+async def _ctx_progress(
+    ctx: Context[ServerSession, AppContext] | _NullContext,
+    progress: float,
+    total: float | None,
+    template: str,
+    *args: Any
+) -> None:
+    """Report progress to the MCP context, formatting the message only if there is one to receive it.
+
+    Args:
+        ctx: MCP context or the null context.
+        progress: Current progress value.
+        total: Total progress value, if known.
+        template: %-style message template.
+        *args: Values substituted into the template.
+    """
+    if ctx is not _NULL_CTX:
+        await ctx.report_progress(progress, total, template % args)
+
+
+async def _get_client(ctx: Context[ServerSession, AppContext] | _NullContext) -> CatalystCenterClient:
+    """Get the API client from the lifespan context, or the shared fallback client."""
+    if ctx is _NULL_CTX:
+        return await _get_fallback_client()
+    return ctx.request_context.lifespan_context.client
+
+
+def mcp_tool_errors(action: str) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """Report tool failures through the MCP context and re-raise them as RuntimeError.
+
+    Args:
+        action: What the tool does, used in error messages. May reference the
+            tool's arguments as format fields (e.g. "fetch client detail for {mac_address}").
+    """
+    def decorator(fn: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            # Binding also finds a context passed positionally
+            bound = signature.bind(*args, **kwargs)
+            try:
+                return await fn(*args, **kwargs)
+            except Exception as e:
+                bound.apply_defaults()
+                arguments = bound.arguments
+                description = action.format_map(arguments)
+                if isinstance(e, InvalidArgumentError):
+                    error_msg = f"Invalid argument: {e}"
+                elif isinstance(e, httpx.HTTPError):
+                    error_msg = f"Failed to {description}: {e}"
+                else:
+                    error_msg = f"Unexpected error trying to {description}: {e}"
+                await (arguments.get("ctx") or _NULL_CTX).error(error_msg)
+                raise RuntimeError(error_msg) from e
+        return wrapper
+    return decorator
+
 
 # Initialize FastMCP server with lifespan management
 mcp = FastMCP("Catalyst Center", lifespan=app_lifespan)
 
 
 @mcp.tool()
+@mcp_tool_errors("fetch client counts")
 async def get_client_counts(
     timestamp: int | None = None,
     ctx: Context[ServerSession, AppContext] | None = None
@@ -216,64 +609,60 @@ async def get_client_counts(
     Raises:
         RuntimeError: If the API request fails or data cannot be retrieved.
     """
-    try:
-        if ctx:
-            await ctx.info("Fetching client counts from Catalyst Center")
-            client = ctx.request_context.lifespan_context.client
-        else:
-            # Fallback for testing without context
-            client = CatalystCenterClient()
-
-        params: dict[str, Any] = {}
-        if timestamp is not None:
-            params["timestamp"] = timestamp
-
-        response = await client.get("/dna/intent/api/v1/client-health", params=params)
-
-        # Parse response to extract client counts by type
-        wired_count = 0
-        wireless_count = 0
-
-        if "response" in response and len(response["response"]) > 0:
-            for site_data in response["response"]:
-                if "scoreDetail" in site_data:
-                    for score in site_data["scoreDetail"]:
-                        category = score.get("scoreCategory", {})
-                        if category.get("value") == "WIRED":
-                            wired_count += score.get("clientCount", 0)
-                        elif category.get("value") == "WIRELESS":
-                            wireless_count += score.get("clientCount", 0)
-
-        total_count = wired_count + wireless_count
-
-        if ctx:
-            await ctx.info(f"Retrieved {wired_count} wired, {wireless_count} wireless ({total_count} total) clients")
-
-        return ClientCounts(
-            wired_count=wired_count,
-            wireless_count=wireless_count,
-            total_count=total_count,
+    ctx = ctx or _NULL_CTX
+    await ctx.info("Fetching client counts from Catalyst Center")
+    client = await _get_client(ctx)
+
+    params = {"timestamp": timestamp} if timestamp is not None else None
+
+    response = await client.get(_CLIENT_HEALTH_PATH, params=params, cache_ttl=DEFAULT_CACHE_TTL)
+
+    sites = response.get("response")
+    if not sites:
+        await ctx.info("No client health data returned")
+        return ClientCounts.model_construct(
+            wired_count=0,
+            wireless_count=0,
+            total_count=0,
             timestamp=timestamp or "current"
         )
-    except httpx.HTTPError as e:
-        error_msg = f"Failed to fetch client counts: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        raise RuntimeError(error_msg) from e
-    except Exception as e:
-        error_msg = f"Unexpected error fetching client counts: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        raise RuntimeError(error_msg) from e
+
+    # Tally client counts by score category in a single pass
+    wired_count = 0
+    wireless_count = 0
+    for site_data in sites:
+        for score in site_data.get("scoreDetail") or ():
+            category = score.get("scoreCategory")
+            if not category:
+                continue
+            value = category.get("value")
+            if value == "WIRED":
+                wired_count += score.get("clientCount", 0)
+            elif value == "WIRELESS":
+                wireless_count += score.get("clientCount", 0)
+
+    total_count = wired_count + wireless_count
+
+    await _ctx_info(ctx, "Retrieved %s wired, %s wireless (%s total) clients", wired_count, wireless_count, total_count)
+
+    return ClientCounts.model_construct(
+        wired_count=wired_count,
+        wireless_count=wireless_count,
+        total_count=total_count,
+        timestamp=timestamp or "current"
+    )
 
 
 @mcp.tool()
+@mcp_tool_errors("fetch network devices")
 async def get_network_devices(
     hostname: str | None = None,
     management_ip: str | None = None,
     device_family: str | None = None,
     device_type: str | None = None,
-    limit: int = 25,
+    limit: Annotated[int, Field(ge=1, le=500)] = 25,
+    total_limit: Annotated[int | None, Field(ge=1, le=10000)] = None,
+    count_only: bool = False,
     ctx: Context[ServerSession, AppContext] | None = None
 ) -> NetworkDevicesResponse:
     """Get list of network devices based on filter criteria.
@@ -287,79 +676,58 @@ async def get_network_devices(
         device_family: Filter by device family (e.g., "Switches and Hubs", "Routers").
         device_type: Filter by device type.
         limit: Maximum number of devices to return (default: 25, max: 500).
+        total_limit: Fetch up to this many devices (max: 10000), overriding limit.
+                     Pages of 500 devices are requested concurrently.
+        count_only: Return only the total number of devices in the inventory matching
+                    the filters, from the device count endpoint. Device details are
+                    not fetched and limit/total_limit are ignored. The count endpoint
+                    only filters by hostname and management_ip, so device_family and
+                    device_type cannot be combined with count_only.
         ctx: MCP context for logging and progress reporting (auto-injected).
 
     Returns:
         NetworkDevicesResponse containing list of matching devices.
 
     Raises:
-        RuntimeError: If the API request fails or data cannot be retrieved.
+        RuntimeError: If count_only is combined with device_family or device_type,
+            or the API request fails or data cannot be retrieved.
     """
-    try:
-        if ctx:
-            await ctx.info("Fetching network devices")
-            await ctx.report_progress(0.0, 1.0, "Starting device query")
-            client = ctx.request_context.lifespan_context.client
-        else:
-            client = CatalystCenterClient()
-
-        params: dict[str, Any] = {"limit": min(limit, 500)}
-
-        if hostname:
-            params["hostname"] = hostname
-        if management_ip:
-            params["managementIpAddress"] = management_ip
-        if device_family:
-            params["family"] = device_family
-        if device_type:
-            params["type"] = device_type
-
-        if ctx:
-            await ctx.report_progress(0.3, 1.0, "Querying Catalyst Center API")
-
-        response = await client.get("/dna/intent/api/v1/network-device", params=params)
-
-        if ctx:
-            await ctx.report_progress(0.7, 1.0, "Processing device data")
-
-        devices = response.get("response", [])
-
-        # Convert to Pydantic models
-        network_devices = [
-            NetworkDevice(
-                hostname=device.get("hostname"),
-                managementIpAddress=device.get("managementIpAddress"),
-                family=device.get("family"),
-                type=device.get("type"),
-                softwareVersion=device.get("softwareVersion"),
-                reachabilityStatus=device.get("reachabilityStatus"),
-                serialNumber=device.get("serialNumber"),
-                id=device.get("id")
-            )
-            for device in devices
-        ]
-
-        if ctx:
-            await ctx.report_progress(1.0, 1.0, f"Retrieved {len(network_devices)} devices")
-            await ctx.info(f"Found {len(network_devices)} matching devices")
-
-        return NetworkDevicesResponse(
-            devices=network_devices,
-            count=len(network_devices)
+    if count_only and (device_family or device_type):
+        raise InvalidArgumentError("count_only cannot be combined with device_family or device_type")
+    ctx = ctx or _NULL_CTX
+    await ctx.info("Fetching network devices")
+    client = await _get_client(ctx)
+
+    params = _filter_params(_DEVICE_FILTER_PARAMS, (hostname, management_ip, device_family, device_type))
+
+    await ctx.report_progress(0.3, 1.0, "Querying Catalyst Center API")
+
+    if count_only:
+        response = await client.get(_NETWORK_DEVICES_COUNT_PATH, params=params, cache_ttl=DEFAULT_CACHE_TTL)
+        count = _COUNT_ADAPTER.validate_python(response.get("response", 0))
+        await _ctx_info(ctx, "Found %s matching devices", count)
+        return NetworkDevicesResponse.model_construct(devices=[], count=count)
+
+    if total_limit is not None:
+        network_devices = await _fetch_pages(
+            client, _NETWORK_DEVICES_PATH, params, _DEVICES_ADAPTER, total_limit, cache_ttl=DEFAULT_CACHE_TTL
         )
-    except httpx.HTTPError as e:
-        error_msg = f"Failed to fetch network devices: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        raise RuntimeError(error_msg) from e
-    except Exception as e:
-        error_msg = f"Unexpected error fetching network devices: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        raise RuntimeError(error_msg) from e
+    else:
+        network_devices = await _get_items(
+            client, _NETWORK_DEVICES_PATH, {"limit": limit, **(params or {})}, _DEVICES_ADAPTER, cache_ttl=DEFAULT_CACHE_TTL
+        )
+
+    await _ctx_progress(ctx, 1.0, 1.0, "Retrieved %s devices", len(network_devices))
+    await _ctx_info(ctx, "Found %s matching devices", len(network_devices))
+
+    return NetworkDevicesResponse.model_construct(
+        devices=network_devices,
+        count=len(network_devices)
+    )
 
 
 @mcp.tool()
+@mcp_tool_errors("fetch network health")
 async def get_network_health(
     timestamp: int | None = None,
     ctx: Context[ServerSession, AppContext] | None = None
@@ -380,53 +748,30 @@ async def get_network_health(
     Raises:
         RuntimeError: If the API request fails or data cannot be retrieved.
     """
-    try:
-        if ctx:
-            await ctx.info("Fetching network health data")
-            client = ctx.request_context.lifespan_context.client
-        else:
-            client = CatalystCenterClient()
-
-        params: dict[str, Any] = {}
-        if timestamp is not None:
-            params["timestamp"] = timestamp
+    ctx = ctx or _NULL_CTX
+    await ctx.info("Fetching network health data")
+    client = await _get_client(ctx)
 
-        response = await client.get("/dna/intent/api/v1/network-health", params=params)
+    params = {"timestamp": timestamp} if timestamp is not None else None
 
-        categories: dict[str, CategoryHealth] = {}
+    response = await client.get(_NETWORK_HEALTH_PATH, params=params, cache_ttl=DEFAULT_CACHE_TTL)
 
-        if "response" in response and len(response["response"]) > 0:
-            for category_data in response["response"]:
-                category = category_data.get("category", "Unknown")
-                categories[category] = CategoryHealth(
-                    healthScore=category_data.get("healthScore", -1),
-                    totalCount=category_data.get("totalCount", 0),
-                    goodCount=category_data.get("goodCount", 0),
-                    badCount=category_data.get("badCount", 0),
-                    fairCount=category_data.get("fairCount", 0),
-                    unmonitoredCount=category_data.get("unmonitoredCount", 0)
-                )
+    categories_data = response.get("response") or []
+    categories = dict(zip(
+        (category_data.get("category", "Unknown") for category_data in categories_data),
+        _CATEGORY_HEALTH_ADAPTER.validate_python(categories_data)
+    ))
 
-        if ctx:
-            await ctx.info(f"Retrieved health data for {len(categories)} device categories")
+    await _ctx_info(ctx, "Retrieved health data for %s device categories", len(categories))
 
-        return NetworkHealthResponse(
-            categories=categories,
-            timestamp=timestamp or "current"
-        )
-    except httpx.HTTPError as e:
-        error_msg = f"Failed to fetch network health: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        raise RuntimeError(error_msg) from e
-    except Exception as e:
-        error_msg = f"Unexpected error fetching network health: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        raise RuntimeError(error_msg) from e
+    return NetworkHealthResponse.model_construct(
+        categories=categories,
+        timestamp=timestamp or "current"
+    )
 
 
 @mcp.tool()
+@mcp_tool_errors("fetch issues")
 async def get_issues(
     priority: str | None = None,
     issue_status: str | None = None,
@@ -454,71 +799,38 @@ async def get_issues(
         IssuesResponse containing list of matching issues.
 
     Raises:
-        RuntimeError: If the API request fails or data cannot be retrieved.
+        RuntimeError: If priority, issue_status or ai_driven is not a valid value,
+            or the API request fails or data cannot be retrieved.
     """
-    try:
-        if ctx:
-            await ctx.info("Fetching network issues")
-            client = ctx.request_context.lifespan_context.client
-        else:
-            client = CatalystCenterClient()
-
-        params: dict[str, Any] = {}
-
-        if priority:
-            params["priority"] = priority
-        if issue_status:
-            params["issueStatus"] = issue_status
-        if site_id:
-            params["siteId"] = site_id
-        if device_id:
-            params["deviceId"] = device_id
-        if mac_address:
-            params["macAddress"] = mac_address
-        if ai_driven:
-            params["aiDriven"] = ai_driven
-
-        response = await client.get("/dna/intent/api/v1/issues", params=params)
-
-        issues_data = response.get("response", [])
-
-        # Convert to Pydantic models
-        issues = [
-            Issue(
-                issueId=issue.get("issueId"),
-                name=issue.get("name"),
-                priority=issue.get("priority"),
-                status=issue.get("status"),
-                category=issue.get("category"),
-                issueOccurenceCount=issue.get("issueOccurenceCount"),
-                lastOccurenceTime=issue.get("lastOccurenceTime")
-            )
-            for issue in issues_data
-        ]
-
-        if ctx:
-            await ctx.info(f"Found {len(issues)} matching issues")
-
-        return IssuesResponse(
-            issues=issues,
-            count=len(issues)
-        )
-    except httpx.HTTPError as e:
-        error_msg = f"Failed to fetch issues: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        raise RuntimeError(error_msg) from e
-    except Exception as e:
-        error_msg = f"Unexpected error fetching issues: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        raise RuntimeError(error_msg) from e
+    # Reject invalid filters before making any request
+    priority = _normalize_choice("priority", priority, _ISSUE_PRIORITIES)
+    issue_status = _normalize_choice("issue_status", issue_status, _ISSUE_STATUSES)
+    ai_driven = _normalize_choice("ai_driven", ai_driven, _AI_DRIVEN_VALUES)
+
+    ctx = ctx or _NULL_CTX
+    await ctx.info("Fetching network issues")
+    client = await _get_client(ctx)
+
+    params = _filter_params(
+        _ISSUE_FILTER_PARAMS,
+        (priority, issue_status, site_id, device_id, mac_address, ai_driven)
+    )
+
+    issues = await _get_items(client, _ISSUES_PATH, params, _ISSUES_ADAPTER)
+
+    await _ctx_info(ctx, "Found %s matching issues", len(issues))
+
+    return IssuesResponse.model_construct(
+        issues=issues,
+        count=len(issues)
+    )
 
 
 @mcp.tool()
+@mcp_tool_errors("fetch site health")
 async def get_site_health(
     site_type: str | None = None,
-    limit: int = 25,
+    limit: Annotated[int, Field(ge=1, le=50)] = 25,
     offset: int = 1,
     ctx: Context[ServerSession, AppContext] | None = None
 ) -> SiteHealthResponse:
@@ -539,60 +851,36 @@ async def get_site_health(
     Raises:
         RuntimeError: If the API request fails or data cannot be retrieved.
     """
-    try:
-        if ctx:
-            await ctx.info("Fetching site health data")
-            client = ctx.request_context.lifespan_context.client
-        else:
-            client = CatalystCenterClient()
-
-        params: dict[str, Any] = {
-            "limit": min(limit, 50),
-            "offset": offset
-        }
-
-        if site_type:
-            params["siteType"] = site_type
-
-        response = await client.get("/dna/intent/api/v1/site-health", params=params)
-
-        sites_data = response.get("response", [])
-
-        # Convert to Pydantic models
-        sites = [
-            SiteHealth(
-                siteName=site.get("siteName"),
-                siteType=site.get("siteType"),
-                healthyNetworkDevicePercentage=site.get("healthyNetworkDevicePercentage"),
-                healthyClientsPercentage=site.get("healthyClientsPercentage"),
-                numberOfClients=site.get("numberOfClients"),
-                numberOfNetworkDevice=site.get("numberOfNetworkDevice"),
-                networkHealthAverage=site.get("networkHealthAverage"),
-                clientHealthAverage=site.get("clientHealthAverage")
-            )
-            for site in sites_data
-        ]
-
-        if ctx:
-            await ctx.info(f"Retrieved health data for {len(sites)} sites")
-
-        return SiteHealthResponse(
-            sites=sites,
-            count=len(sites)
-        )
-    except httpx.HTTPError as e:
-        error_msg = f"Failed to fetch site health: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        raise RuntimeError(error_msg) from e
-    except Exception as e:
-        error_msg = f"Unexpected error fetching site health: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        raise RuntimeError(error_msg) from e
+    ctx = ctx or _NULL_CTX
+    await ctx.info("Fetching site health data")
+    client = await _get_client(ctx)
+
+    params: dict[str, Any] = {
+        "limit": limit,
+        "offset": offset
+    }
+
+    if site_type:
+        params["siteType"] = site_type
+
+    sites = await _get_items(
+        client,
+        _SITE_HEALTH_PATH,
+        params,
+        _SITES_ADAPTER,
+        cache_ttl=DEFAULT_CACHE_TTL
+    )
+
+    await _ctx_info(ctx, "Retrieved health data for %s sites", len(sites))
+
+    return SiteHealthResponse.model_construct(
+        sites=sites,
+        count=len(sites)
+    )
 
 
 @mcp.tool()
+@mcp_tool_errors("fetch client detail for {mac_address}")
 async def get_client_detail(
     mac_address: str,
     timestamp: int | None = None,
@@ -615,42 +903,29 @@ async def get_client_detail(
     Raises:
         RuntimeError: If the API request fails or data cannot be retrieved.
     """
-    try:
-        if ctx:
-            await ctx.info(f"Fetching details for client {mac_address}")
-            client = ctx.request_context.lifespan_context.client
-        else:
-            client = CatalystCenterClient()
+    ctx = ctx or _NULL_CTX
+    await _ctx_info(ctx, "Fetching details for client %s", mac_address)
+    client = await _get_client(ctx)
 
-        params: dict[str, Any] = {"macAddress": mac_address}
+    params: dict[str, Any] = {"macAddress": mac_address}
 
-        if timestamp is not None:
-            params["timestamp"] = timestamp
+    if timestamp is not None:
+        params["timestamp"] = timestamp
 
-        response = await client.get("/dna/intent/api/v1/client-detail", params=params)
+    response = await client.get(_CLIENT_DETAIL_PATH, params=params)
 
-        if ctx:
-            await ctx.info(f"Retrieved detailed information for client {mac_address}")
+    await _ctx_info(ctx, "Retrieved detailed information for client %s", mac_address)
 
-        return response
-    except httpx.HTTPError as e:
-        error_msg = f"Failed to fetch client detail for {mac_address}: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        raise RuntimeError(error_msg) from e
-    except Exception as e:
-        error_msg = f"Unexpected error fetching client detail: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        raise RuntimeError(error_msg) from e
+    return response
 
 
 @mcp.tool()
+@mcp_tool_errors("fetch compliance details")
 async def get_compliance_detail(
     compliance_type: str | None = None,
     compliance_status: str | None = None,
     device_uuid: str | None = None,
-    limit: int = 100,
+    limit: Annotated[int, Field(ge=1, le=500)] = 100,
     offset: int = 1,
     ctx: Context[ServerSession, AppContext] | None = None
 ) -> ComplianceDetailResponse:
@@ -678,73 +953,31 @@ async def get_compliance_detail(
     Raises:
         RuntimeError: If the API request fails or data cannot be retrieved.
     """
-    try:
-        if ctx:
-            await ctx.info("Fetching compliance details")
-            await ctx.report_progress(0.0, 1.0, "Starting compliance query")
-            client = ctx.request_context.lifespan_context.client
-        else:
-            client = CatalystCenterClient()
-
-        params: dict[str, Any] = {
-            "limit": min(limit, 500),
-            "offset": offset
-        }
-
-        if compliance_type:
-            params["complianceType"] = compliance_type
-        if compliance_status:
-            params["complianceStatus"] = compliance_status
-        if device_uuid:
-            params["deviceUuid"] = device_uuid
-
-        if ctx:
-            await ctx.report_progress(0.3, 1.0, "Querying Catalyst Center API")
-
-        response = await client.get("/dna/intent/api/v1/compliance/detail", params=params)
-
-        if ctx:
-            await ctx.report_progress(0.7, 1.0, "Processing compliance data")
-
-        compliance_data = response.get("response", [])
-
-        # Convert to Pydantic models
-        devices = [
-            ComplianceDetail(
-                deviceUuid=item.get("deviceUuid", ""),
-                displayName=item.get("displayName"),
-                complianceType=item.get("complianceType", ""),
-                status=item.get("status", ""),
-                category=item.get("category"),
-                lastSyncTime=item.get("lastSyncTime"),
-                lastUpdateTime=item.get("lastUpdateTime"),
-                state=item.get("state"),
-                remediationSupported=item.get("remediationSupported")
-            )
-            for item in compliance_data
-        ]
-
-        if ctx:
-            await ctx.report_progress(1.0, 1.0, f"Retrieved {len(devices)} compliance records")
-            await ctx.info(f"Found {len(devices)} devices with compliance data")
-
-        return ComplianceDetailResponse(
-            devices=devices,
-            count=len(devices)
-        )
-    except httpx.HTTPError as e:
-        error_msg = f"Failed to fetch compliance details: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        raise RuntimeError(error_msg) from e
-    except Exception as e:
-        error_msg = f"Unexpected error fetching compliance details: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        raise RuntimeError(error_msg) from e
+    ctx = ctx or _NULL_CTX
+    await ctx.info("Fetching compliance details")
+    client = await _get_client(ctx)
+
+    params: dict[str, Any] = {
+        "limit": limit,
+        "offset": offset,
+        **(_filter_params(_COMPLIANCE_FILTER_PARAMS, (compliance_type, compliance_status, device_uuid)) or {})
+    }
+
+    await ctx.report_progress(0.3, 1.0, "Querying Catalyst Center API")
+
+    devices = await _get_items(client, _COMPLIANCE_DETAIL_PATH, params, _COMPLIANCE_ADAPTER)
+
+    await _ctx_progress(ctx, 1.0, 1.0, "Retrieved %s compliance records", len(devices))
+    await _ctx_info(ctx, "Found %s devices with compliance data", len(devices))
+
+    return ComplianceDetailResponse.model_construct(
+        devices=devices,
+        count=len(devices)
+    )
 
 
 @mcp.tool()
+@mcp_tool_errors("fetch compliance count")
 async def get_compliance_count(
     compliance_type: str | None = None,
     compliance_status: str | None = None,
@@ -770,45 +1003,96 @@ async def get_compliance_count(
     Raises:
         RuntimeError: If the API request fails or data cannot be retrieved.
     """
-    try:
-        if ctx:
-            await ctx.info("Fetching compliance count")
-            client = ctx.request_context.lifespan_context.client
-        else:
-            client = CatalystCenterClient()
+    ctx = ctx or _NULL_CTX
+    await ctx.info("Fetching compliance count")
+    client = await _get_client(ctx)
 
-        params: dict[str, Any] = {}
+    params = _filter_params(_COMPLIANCE_FILTER_PARAMS, (compliance_type, compliance_status))
 
-        if compliance_type:
-            params["complianceType"] = compliance_type
-        if compliance_status:
-            params["complianceStatus"] = compliance_status
+    response = await client.get(
+        _COMPLIANCE_COUNT_PATH,
+        params=params,
+        cache_ttl=_AGGREGATE_CACHE_TTL
+    )
 
-        response = await client.get("/dna/intent/api/v1/compliance/detail/count", params=params)
+    count = response.get("response", 0)
 
-        count = response.get("response", 0)
+    await _ctx_info(ctx, "Found %s devices matching compliance criteria", count)
 
-        if ctx:
-            await ctx.info(f"Found {count} devices matching compliance criteria")
+    return ComplianceCountResponse(
+        count=count,
+        compliance_type=compliance_type,
+        compliance_status=compliance_status
+    )
 
-        return ComplianceCountResponse(
-            count=count,
-            compliance_type=compliance_type,
-            compliance_status=compliance_status
-        )
-    except httpx.HTTPError as e:
-        error_msg = f"Failed to fetch compliance count: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        raise RuntimeError(error_msg) from e
-    except Exception as e:
-        error_msg = f"Unexpected error fetching compliance count: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        raise RuntimeError(error_msg) from e
+
+@mcp.tool()
+@mcp_tool_errors("fetch all compliance details")
+async def get_all_compliance_detail(
+    compliance_type: str | None = None,
+    compliance_status: str | None = None,
+    max_records: Annotated[int, Field(ge=1, le=10000)] = 10000,
+    ctx: Context[ServerSession, AppContext] | None = None
+) -> ComplianceDetailResponse:
+    """Get compliance status for all devices matching the filters.
+
+    Looks up the number of matching records first, then fetches every page
+    concurrently instead of requiring sequential paginated calls to
+    get_compliance_detail.
+
+    Args:
+        compliance_type: Filter by compliance type(s), comma-separated.
+                        Valid types: APPLICATION_VISIBILITY, EOX, FABRIC, IMAGE,
+                        NETWORK_PROFILE, NETWORK_SETTINGS, PSIRT, RUNNING_CONFIG, WORKFLOW.
+        compliance_status: Filter by compliance status(es), comma-separated.
+                          Valid statuses: COMPLIANT, NON_COMPLIANT, IN_PROGRESS,
+                          NOT_AVAILABLE, NOT_APPLICABLE, ERROR.
+        max_records: Maximum number of records to fetch (default and max: 10000).
+                     If more records match, the response is marked as truncated.
+        ctx: MCP context for logging and progress reporting (auto-injected).
+
+    Returns:
+        ComplianceDetailResponse containing compliance details for all matching devices.
+
+    Raises:
+        RuntimeError: If the API request fails or data cannot be retrieved.
+    """
+    ctx = ctx or _NULL_CTX
+    await ctx.info("Fetching all compliance details")
+    await ctx.report_progress(0.0, 1.0, "Counting compliance records")
+    client = await _get_client(ctx)
+
+    params = _filter_params(_COMPLIANCE_FILTER_PARAMS, (compliance_type, compliance_status))
+
+    # Not cached: a stale count would truncate the page ranges
+    count_response = await client.get(
+        _COMPLIANCE_COUNT_PATH,
+        params=params
+    )
+    total = count_response.get("response", 0)
+    truncated = total > max_records
+    if truncated:
+        await _ctx_info(ctx, "%s compliance records match; fetching the first %s", total, max_records)
+        total = max_records
+
+    await _ctx_progress(ctx, 0.3, 1.0, "Fetching %s compliance records", total)
+
+    devices = await _fetch_pages(
+        client, _COMPLIANCE_DETAIL_PATH, params, _COMPLIANCE_ADAPTER, total
+    )
+
+    await _ctx_progress(ctx, 1.0, 1.0, "Retrieved %s compliance records", len(devices))
+    await _ctx_info(ctx, "Found %s devices with compliance data", len(devices))
+
+    return ComplianceDetailResponse.model_construct(
+        devices=devices,
+        count=len(devices),
+        truncated=truncated
+    )
 
 
 @mcp.tool()
+@mcp_tool_errors("fetch EoX summary")
 async def get_eox_summary(
     ctx: Context[ServerSession, AppContext] | None = None
 ) -> EoXSummaryResponse:
@@ -827,47 +1111,26 @@ async def get_eox_summary(
     Raises:
         RuntimeError: If the API request fails or data cannot be retrieved.
     """
-    try:
-        if ctx:
-            await ctx.info("Fetching EoX summary")
-            client = ctx.request_context.lifespan_context.client
-        else:
-            client = CatalystCenterClient()
+    ctx = ctx or _NULL_CTX
+    await ctx.info("Fetching EoX summary")
+    client = await _get_client(ctx)
 
-        response = await client.get("/dna/intent/api/v1/eox-status/summary")
+    response = await client.get(_EOX_SUMMARY_PATH, cache_ttl=_AGGREGATE_CACHE_TTL)
 
-        summary = response.get("response", {})
+    summary = EoXSummaryResponse.model_validate(response.get("response") or {})
 
-        hardware_count = summary.get("hardwareCount", 0)
-        software_count = summary.get("softwareCount", 0)
-        module_count = summary.get("moduleCount", 0)
-        total_count = summary.get("totalCount", 0)
+    await _ctx_info(ctx, "EoX Summary - Total: %s (HW: %s, SW: %s, Modules: %s)", summary.total_count, summary.hardware_count, summary.software_count, summary.module_count)
 
-        if ctx:
-            await ctx.info(f"EoX Summary - Total: {total_count} (HW: {hardware_count}, SW: {software_count}, Modules: {module_count})")
-
-        return EoXSummaryResponse(
-            hardware_count=hardware_count,
-            software_count=software_count,
-            module_count=module_count,
-            total_count=total_count
-        )
-    except httpx.HTTPError as e:
-        error_msg = f"Failed to fetch EoX summary: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        raise RuntimeError(error_msg) from e
-    except Exception as e:
-        error_msg = f"Unexpected error fetching EoX summary: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        raise RuntimeError(error_msg) from e
+    return summary
 
 
 @mcp.tool()
+@mcp_tool_errors("fetch EoX devices")
 async def get_eox_devices(
-    limit: int = 100,
+    limit: Annotated[int, Field(ge=1, le=500)] = 100,
     offset: int = 1,
+    fetch_all: bool = False,
+    max_records: Annotated[int, Field(ge=1, le=10000)] = 10000,
     ctx: Context[ServerSession, AppContext] | None = None
 ) -> EoXDevicesResponse:
     """Get EoX status for all devices in the network.
@@ -878,7 +1141,12 @@ async def get_eox_devices(
 
     Args:
         limit: Maximum number of devices to return (default: 100, max: 500).
+               Ignored with fetch_all, which requests pages of 500 devices.
         offset: Offset for pagination, 1-based indexing (default: 1).
+        fetch_all: Return all devices from offset onwards, requesting pages concurrently.
+        max_records: With fetch_all, the maximum number of devices to fetch (default
+                     and max: 10000). If more devices exist, the response is marked
+                     as truncated.
         ctx: MCP context for logging and progress reporting (auto-injected).
 
     Returns:
@@ -887,83 +1155,94 @@ async def get_eox_devices(
     Raises:
         RuntimeError: If the API request fails or data cannot be retrieved.
     """
-    try:
-        if ctx:
-            await ctx.info("Fetching EoX device status")
-            await ctx.report_progress(0.0, 1.0, "Starting EoX device query")
-            client = ctx.request_context.lifespan_context.client
-        else:
-            client = CatalystCenterClient()
-
-        params: dict[str, Any] = {
-            "limit": min(limit, 500),
-            "offset": offset
-        }
-
-        if ctx:
-            await ctx.report_progress(0.3, 1.0, "Querying Catalyst Center API")
-
-        response = await client.get("/dna/intent/api/v1/eox-status/device", params=params)
-
-        if ctx:
-            await ctx.report_progress(0.7, 1.0, "Processing EoX device data")
-
-        devices_data = response.get("response", [])
-
-        # Convert to Pydantic models
-        devices = []
-        for item in devices_data:
-            # Parse summary array to extract counts by type
-            summary_list = item.get("summary", [])
-            hardware_count = None
-            software_count = None
-            module_count = None
-            
-            if isinstance(summary_list, list):
-                for summary_item in summary_list:
-                    eox_type = summary_item.get("eoxType", "")
-                    count = summary_item.get("count", 0)
-                    if eox_type == "HARDWARE":
-                        hardware_count = count
-                    elif eox_type == "SOFTWARE":
-                        software_count = count
-                    elif eox_type == "MODULE":
-                        module_count = count
-            
-            devices.append(
-                EoXDeviceSummary(
-                    device_id=item.get("deviceId", ""),
-                    alert_count=item.get("alertCount", 0),
-                    hardware_count=hardware_count,
-                    software_count=software_count,
-                    module_count=module_count,
-                    scan_status=item.get("scanStatus"),
-                    last_scan_time=item.get("lastScanTime"),
-                    comments=item.get("comments")
-                )
-            )
-
-        if ctx:
-            await ctx.report_progress(1.0, 1.0, f"Retrieved {len(devices)} devices with EoX data")
-            await ctx.info(f"Found {len(devices)} devices with EoX information")
-
-        return EoXDevicesResponse(
-            devices=devices,
-            count=len(devices)
+    ctx = ctx or _NULL_CTX
+    await ctx.info("Fetching EoX device status")
+    client = await _get_client(ctx)
+
+    page_size = _MAX_PAGE_SIZE if fetch_all else limit
+
+    async def fetch_page(page_offset: int) -> list[EoXDeviceSummary]:
+        return await _get_items(
+            client,
+            _EOX_DEVICES_PATH,
+            {"limit": page_size, "offset": page_offset},
+            _EOX_DEVICES_ADAPTER
         )
-    except httpx.HTTPError as e:
-        error_msg = f"Failed to fetch EoX devices: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        raise RuntimeError(error_msg) from e
-    except Exception as e:
-        error_msg = f"Unexpected error fetching EoX devices: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        raise RuntimeError(error_msg) from e
+
+    await ctx.report_progress(0.3, 1.0, "Querying Catalyst Center API")
+
+    truncated = False
+    if fetch_all:
+        devices, truncated = await _fetch_all_pages(fetch_page, page_size, max_records, offset)
+        if truncated:
+            await _ctx_info(ctx, "More than %s devices have EoX data; returning the first %s", max_records, max_records)
+    else:
+        devices = await fetch_page(offset)
+
+    await _ctx_progress(ctx, 1.0, 1.0, "Retrieved %s devices with EoX data", len(devices))
+    await _ctx_info(ctx, "Found %s devices with EoX information", len(devices))
+
+    return EoXDevicesResponse.model_construct(
+        devices=devices,
+        count=len(devices),
+        truncated=truncated
+    )
+
+
+# Number of streamed items between progress notifications
+_STREAM_PROGRESS_INTERVAL = 50
 
 
 @mcp.tool()
+@mcp_tool_errors("stream EoX devices")
+async def get_eox_devices_stream(
+    limit: Annotated[int, Field(ge=1, le=500)] = 500,
+    offset: int = 1,
+    ctx: Context[ServerSession, AppContext] | None = None
+) -> EoXDevicesResponse:
+    """Get EoX status for devices, processing the response as it arrives.
+
+    Same data as get_eox_devices, but the API response is parsed
+    incrementally and progress is reported as devices are received, so
+    large pages never have to be buffered in full before processing.
+    Progress updates use limit as the total, which is an upper bound on
+    the number of devices received.
+
+    Args:
+        limit: Maximum number of devices to return (default: 500, max: 500).
+        offset: Offset for pagination, 1-based indexing (default: 1).
+        ctx: MCP context for logging and progress reporting (auto-injected).
+
+    Returns:
+        EoXDevicesResponse containing EoX information for devices.
+
+    Raises:
+        RuntimeError: If the API request fails or data cannot be retrieved.
+    """
+    ctx = ctx or _NULL_CTX
+    await ctx.info("Streaming EoX device status")
+    client = await _get_client(ctx)
+
+    devices = []
+    async for item in client.stream_json_array(
+        _EOX_DEVICES_PATH,
+        params={"limit": limit, "offset": offset}
+    ):
+        devices.append(EoXDeviceSummary.model_validate(item))
+        if len(devices) % _STREAM_PROGRESS_INTERVAL == 0:
+            await _ctx_progress(ctx, len(devices), limit, "Received %s devices", len(devices))
+
+    await _ctx_progress(ctx, len(devices), len(devices), "Retrieved %s devices with EoX data", len(devices))
+    await _ctx_info(ctx, "Found %s devices with EoX information", len(devices))
+
+    return EoXDevicesResponse.model_construct(
+        devices=devices,
+        count=len(devices)
+    )
+
+
+@mcp.tool()
+@mcp_tool_errors("fetch EoX details for device {device_id}")
 async def get_eox_device_details(
     device_id: str,
     ctx: Context[ServerSession, AppContext] | None = None
@@ -982,65 +1261,110 @@ async def get_eox_device_details(
         EoXDeviceDetailsResponse containing detailed EoX bulletins.
 
     Raises:
-        RuntimeError: If the API request fails or data cannot be retrieved.
+        RuntimeError: If device_id is not a UUID, or the API request fails
+            or data cannot be retrieved.
     """
-    try:
-        if ctx:
-            await ctx.info(f"Fetching EoX details for device {device_id}")
-            client = ctx.request_context.lifespan_context.client
+    _check_device_id(device_id)
+    ctx = ctx or _NULL_CTX
+    await _ctx_info(ctx, "Fetching EoX details for device %s", device_id)
+    client = await _get_client(ctx)
+
+    details = await _fetch_eox_device_details(client, device_id)
+
+    await _ctx_info(ctx, "Retrieved %s EoX bulletins for device %s", len(details.eox_details), device_id)
+
+    return details
+
+
+# Maximum number of devices fetched concurrently by batch tools
+_BATCH_CONCURRENCY = 8
+
+
+@mcp.tool()
+@mcp_tool_errors("fetch EoX details batch")
+async def get_eox_device_details_batch(
+    device_ids: Annotated[list[str], Field(min_length=1, max_length=100)],
+    ctx: Context[ServerSession, AppContext] | None = None
+) -> EoXDeviceDetailsBatchResponse:
+    """Get detailed End-of-Life/End-of-Support information for multiple devices.
+
+    Fetches the EoX bulletin details of each device concurrently in a single
+    tool call. A device that cannot be retrieved is reported in ``errors``
+    instead of failing the whole batch.
+
+    Args:
+        device_ids: Device UUIDs (1 to 100), e.g. from get_eox_devices.
+        ctx: MCP context for logging and progress reporting (auto-injected).
+
+    Returns:
+        EoXDeviceDetailsBatchResponse containing detailed EoX bulletins per device
+        and an error message for each device that could not be retrieved.
+
+    Raises:
+        RuntimeError: If the batch cannot be processed.
+    """
+    ctx = ctx or _NULL_CTX
+    await _ctx_info(ctx, "Fetching EoX details for %s devices", len(device_ids))
+    client = await _get_client(ctx)
+
+    semaphore = asyncio.Semaphore(_BATCH_CONCURRENCY)
+
+    async def fetch(device_id: str) -> EoXDeviceDetailsResponse:
+        # Invalid IDs fail here without taking a concurrency slot
+        _check_device_id(device_id)
+        async with semaphore:
+            return await _fetch_eox_device_details(client, device_id)
+
+    results = await asyncio.gather(*(fetch(device_id) for device_id in device_ids), return_exceptions=True)
+
+    devices = []
+    errors = {}
+    for device_id, result in zip(device_ids, results):
+        if isinstance(result, BaseException):
+            errors[device_id] = str(result)
         else:
-            client = CatalystCenterClient()
-
-        response = await client.get(f"/dna/intent/api/v1/eox-status/device/{device_id}")
-
-        device_data = response.get("response", {})
-
-        eox_details_data = device_data.get("eoxDetails", [])
-
-        # Convert to Pydantic models
-        eox_details = [
-            EoXBulletin(
-                bulletinNumber=item.get("bulletinNumber"),
-                bulletinName=item.get("bulletinName"),
-                eoxType=item.get("eoxType"),
-                bulletinURL=item.get("bulletinURL"),
-                endOfLifeDate=item.get("endOfLifeDate"),
-                endOfSaleDate=item.get("endOfSaleDate"),
-                endOfSupportDate=item.get("endOfSupportDate"),
-                endOfSWMaintenanceDate=item.get("endOfSWMaintenanceDate"),
-                endOfSecurityVulnerabilityDate=item.get("endOfSecurityVulnerabilityDate"),
-                lastDateOfSupport=item.get("lastDateOfSupport")
-            )
-            for item in eox_details_data
-        ]
-
-        if ctx:
-            await ctx.info(f"Retrieved {len(eox_details)} EoX bulletins for device {device_id}")
-
-        return EoXDeviceDetailsResponse(
-            device_id=device_data.get("deviceId", device_id),
-            alert_count=device_data.get("alertCount", 0),
-            eox_details=eox_details,
-            scan_status=device_data.get("scanStatus"),
-            last_scan_time=device_data.get("lastScanTime")
-        )
-    except httpx.HTTPError as e:
-        error_msg = f"Failed to fetch EoX details for device {device_id}: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        raise RuntimeError(error_msg) from e
-    except Exception as e:
-        error_msg = f"Unexpected error fetching EoX details: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        raise RuntimeError(error_msg) from e
+            devices.append(result)
+
+    await _ctx_info(ctx, "Retrieved EoX details for %s devices (%s failed)", len(devices), len(errors))
+
+    return EoXDeviceDetailsBatchResponse.model_construct(
+        devices=devices,
+        errors=errors,
+        count=len(devices)
+    )
 
 
 if __name__ == "__main__":
+    import argparse
     import sys
 
+    # Use the libuv-based event loop where available
+    if sys.platform != "win32":
+        try:
+            import uvloop
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        except ImportError:
+            pass
+
+    parser = argparse.ArgumentParser(description="Cisco Catalyst Center MCP server")
+    parser.add_argument("--http", action="store_true", help="serve over HTTP (SSE) instead of stdio")
+    parser.add_argument("--keepalive", type=int, default=30, help="HTTP keep-alive timeout in seconds (default: 30)")
+    parser.add_argument("--limit-concurrency", type=int, default=None, help="maximum concurrent HTTP connections before rejecting with 503")
+    parser.add_argument("--backlog", type=int, default=2048, help="maximum pending socket connections (default: 2048)")
+    args = parser.parse_args()
+
     # Support both stdio (default) and HTTP transports
-    if "--http" in sys.argv:
-        mcp.run(transport="sse")
+    if args.http:
+        import uvicorn
+
+        uvicorn.run(
+            mcp.sse_app(),
+            host=mcp.settings.host,
+            port=mcp.settings.port,
+            log_level=mcp.settings.log_level.lower(),
+            timeout_keep_alive=args.keepalive,
+            limit_concurrency=args.limit_concurrency,
+            backlog=args.backlog
+        )
     else:
         mcp.run()  # stdio by default